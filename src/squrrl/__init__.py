@@ -1,7 +1,6 @@
 # from . import core
 # from .select import SELECT, _WithContext
 
-# from copy import deepcopy
 # from typing import LiteralString
 
 
@@ -25,7 +24,7 @@
 #     def __init__(
 #         self, building_statement: core.Statement, w: core.WITH
 #     ) -> None:
-#         self.statement = deepcopy(building_statement)
+#         self.statement = {**building_statement}
 #         self.statement["WITH"] = w
 
 
@@ -5,51 +5,41 @@ from . import utils
 from abc import ABC, abstractmethod
 from typing import (
     Any,
+    Final,
     Literal,
     TypeVar,
     ClassVar,
-    Protocol,
-    Annotated,
-    TypeAlias,
     TypedDict,
-    TypeGuard,
     NotRequired,
     LiteralString,
+    cast,
     final,
-    overload,
 )
-from functools import cached_property
-from dataclasses import dataclass
+from weakref import WeakKeyDictionary
+from dataclasses import field, dataclass
 
 from typing_extensions import override
 
 
 T = TypeVar("T")
 
-try:
-    from pydantic import Discriminator
-
-    _Discriminator = Discriminator
-except ModuleNotFoundError | ImportError:
-    _Discriminator = None
-
-import enum
-
 
 ################################################################################
 # START OF STANDARD DEFINITIONS (SCHEMA, TABLE, COLUMN, PARAM)
 ################################################################################
 
 
-class SupportedStatement(str, enum.Enum):
-    SELECT = "SELECT"
-    INSERT = "INSERT"
-    UPDATE = "UPDATE"
-    DELETE = "DELETE"
+class SupportedStatement:
+    """Values of the `type` key of a statement."""
+
+    SELECT: Final = "SELECT"
+    INSERT: Final = "INSERT"
+    UPDATE: Final = "UPDATE"
+    DELETE: Final = "DELETE"
 
 
 class Statement_SELECT(TypedDict):
-    type: Literal[SupportedStatement.SELECT]
+    type: Literal["SELECT"]
     WITH: NotRequired[WITH]
     SELECT: SELECT
     FROM: NotRequired[FROM]
@@ -65,17 +55,17 @@ class Statement_SELECT(TypedDict):
 
 
 class Statement_INSERT(TypedDict):
-    type: Literal[SupportedStatement.INSERT]
+    type: Literal["INSERT"]
     WITH: NotRequired[WITH]
 
 
 class Statement_UPDATE(TypedDict):
-    type: Literal[SupportedStatement.UPDATE]
+    type: Literal["UPDATE"]
     WITH: NotRequired[WITH]
 
 
 class Statement_DELETE(TypedDict):
-    type: Literal[SupportedStatement.DELETE]
+    type: Literal["DELETE"]
     WITH: NotRequired[WITH]
 
 
@@ -85,30 +75,43 @@ Statement = (
 
 
 class _HasStateSelect(ABC):
+    """Base class of the builders that carry a SELECT statement.
+
+    Each builder step takes a shallow copy of the statement it was called on
+    and only sets its own clause (see `_extend`), so the clause objects are
+    shared between steps and must be treated as immutable once assigned.
+    """
+
+    __slots__ = ("statement",)
+
     statement: Statement_SELECT
 
+    _CLAUSE_ORDER: ClassVar[tuple[LiteralString, ...]] = (
+        "WITH",
+        "SELECT",
+        "FROM",
+        "WHERE",
+        "GROUP_BY",
+        "WINDOW",
+        "SET_OPERATIONS",
+        "ORDER_BY",
+        "LIMIT",
+        "OFFSET",
+        "FETCH",
+    )
+
     def get_sql(self, indent: int | None = None) -> LiteralString:
         indent_ = indent or 0
         res: list[LiteralString] = []
-        order = [
-            "WITH",
-            "SELECT",
-            "FROM",
-            "WHERE",
-            "GROUP_BY",
-            "WINDOW",
-            "SET_OPERATIONS",
-            "ORDER_BY",
-            "LIMIT",
-            "OFFSET",
-            "FETCH",
-        ]
+        statement = self.statement
 
-        for part in order:
-            if part not in self.statement:
+        for part in self._CLAUSE_ORDER:
+            # A plain string key makes TypedDict.get return `object`.
+            clause = cast("_SQLPart | None", statement.get(part))
+            if clause is None:
                 continue
 
-            tmp = self.statement[part].get_sql_parts(indent_)
+            tmp = clause.get_sql_parts(indent_)
             if isinstance(tmp, str):
                 res.append(tmp)
             else:
@@ -119,9 +122,25 @@ class _HasStateSelect(ABC):
         return "\n".join(res)
 
 
+def _extend(
+    statement: Statement_SELECT,
+    key: Literal["FROM", "WHERE", "GROUP_BY", "HAVING", "ORDER_BY"],
+    clause: FROM | WHERE | GROUP_BY | HAVING | ORDER_BY,
+) -> Statement_SELECT:
+    """Shallow copy `statement` with `key` set to `clause`.
+
+    Every other clause is shared with `statement`, not copied.
+    """
+    new_statement = statement.copy()
+    new_statement[key] = clause
+    return new_statement
+
+
 class _SQLPart(ABC):
     """Base class of all SQL parts has get_sql_parts method."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_sql_parts(
         self, indent: int
@@ -131,16 +150,16 @@ class _SQLPart(ABC):
 class ColumnDerivable(_SQLPart, ABC):
     """Shits that **may** result in 1 row and 1 column."""
 
-    pass
+    __slots__ = ()
 
 
 class TableDerivable(ColumnDerivable, ABC):
     """Shits that **may** result in a table."""
 
-    pass
+    __slots__ = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Param(ColumnDerivable):
     """A place holder for parameter."""
 
@@ -150,17 +169,21 @@ class Param(ColumnDerivable):
         param_str: LiteralString = "%s"
 
     name: LiteralString | None = None
-
-    @cached_property
-    def placeholder(self) -> LiteralString:
-        """Get placeholder from name, e.g. "name" -> ":name"."""
-        if self.name:
-            return ":" + self.name
-        else:
-            return Param.Config.param_str
+    placeholder: LiteralString | None = field(
+        init=False, repr=False, compare=False
+    )
+    """Placeholder from name, e.g. "name" -> ":name". None if unnamed."""
+
+    def __post_init__(self) -> None:
+        """Compute `placeholder` from `name`."""
+        # Computed once here so reads are a plain attribute load. Unnamed
+        # params keep reading `Config.param_str` when they are emitted.
+        object.__setattr__(
+            self, "placeholder", ":" + self.name if self.name else None
+        )
 
     def get_sql_parts(self, indent: int) -> LiteralString:
-        return f":{self.name}" if self.name else self.Config.param_str
+        return self.placeholder or Param.Config.param_str
 
 
 class Column(ColumnDerivable):
@@ -170,9 +193,13 @@ class Column(ColumnDerivable):
     the class attribute it's assigned to.
     """
 
-    name: LiteralString | None
-    schema_name: LiteralString | None
-    table_name: LiteralString | None
+    __slots__ = ("_bound", "_name", "_path", "_schema_name", "_table_name")
+
+    _name: LiteralString | None
+    _schema_name: LiteralString | None
+    _table_name: LiteralString | None
+    _path: LiteralString | None
+    _bound: WeakKeyDictionary[TableMeta, Column] | None
 
     def __init__(
         self,
@@ -188,9 +215,27 @@ class Column(ColumnDerivable):
             pk = Column()  # <-- name will be "pk"
         ```
         """
-        self.name = name
-        self.schema_name = schema_name
-        self.table_name = table_name
+        self._name = name
+        self._schema_name = schema_name
+        self._table_name = table_name
+        self._path = self._build_path()
+        self._bound = None
+
+    # Read-only, since `_path` is built from these once and would go stale.
+    @property
+    def name(self) -> LiteralString | None:
+        """Column name, e.g. "id"."""
+        return self._name
+
+    @property
+    def schema_name(self) -> LiteralString | None:
+        """Schema the column is qualified with, if any."""
+        return self._schema_name
+
+    @property
+    def table_name(self) -> LiteralString | None:
+        """Table path the column is qualified with, if any."""
+        return self._table_name
 
     def get_sql_parts(self, indent: int) -> LiteralString:
         return self.get_path()
@@ -204,33 +249,47 @@ class Column(ColumnDerivable):
         `name` is the attribute name (e.g., "pk").
         """
         # If the user didn't provide a name in __init__ (it's None)...
-        if self.name is None:
-            self.name = name
+        if self._name is None:
+            self._name = name
+            self._path = self._build_path()
+
+    def _build_path(self) -> LiteralString | None:
+        if self._name is None:
+            return None
+        return utils.cat(
+            self._schema_name, self._table_name, self._name, delim="."
+        )
 
     def get_path(self) -> LiteralString:
         """Returns the fully-qualified path of the field."""
-        if self.name is None:
+        if self._path is None:
             # name was None and __set_name__ never ran
             raise AttributeError(
                 "Field was not properly initialized. "
                 + "Ensure it is assigned as a class attribute."
             )
-        return utils.cat(
-            self.schema_name, self.table_name, self.name, delim="."
-        )
+        return self._path
 
     def __get__(self, obj: Any, objtype: type | None = None) -> Column:
         """Called on class access (e.g., TestTable.id).
 
         `obj` is None, `objtype` is the class (TestTable).
         """
-        if obj is None and objtype is not None and issubclass(objtype, Table):
-            if self.name is None:
-                raise AttributeError(
-                    "Field has no name. Was it assigned to a class attribute?"
-                )
-            table_path = objtype.get_sql_parts(0)
-            return Column(self.name, table_name=table_path)
+        if obj is None and isinstance(objtype, TableMeta):
+            # The bound column only depends on the table class, so build it
+            # once per class and hand out the same object afterwards.
+            if self._bound is None:
+                self._bound = WeakKeyDictionary()
+            bound = self._bound.get(objtype)
+            if bound is None:
+                if self.name is None:
+                    raise AttributeError(
+                        "Field has no name. "
+                        + "Was it assigned to a class attribute?"
+                    )
+                bound = Column(self.name, table_name=objtype._path)
+                self._bound[objtype] = bound
+            return bound
 
         # Instance access (e.g., my_table_instance.id) is not supported here.
         raise AttributeError(
@@ -242,6 +301,8 @@ class Column(ColumnDerivable):
 
 
 class ColumnAlias(ColumnDerivable):
+    __slots__ = ("alias", "col")
+
     def __init__(self, name: LiteralString, col: Column) -> None:
         self.alias: LiteralString = name
         self.col: Column = col
@@ -257,6 +318,8 @@ class TableMeta(type):
     2. Store this path in `_path` on the class.
     """
 
+    _path: LiteralString
+
     def __new__(cls, name: str, bases: tuple[type], attrs: dict[str, Any]):
         if "_table_name" not in attrs:
             attrs["_table_name"] = name.lower()
@@ -267,6 +330,12 @@ class TableMeta(type):
         if "_schema_name" not in attrs:
             attrs["_schema_name"] = None
 
+        # Always recomputed: SchemaMeta copies the original table's
+        # namespace, including its unqualified `_path`.
+        attrs["_path"] = utils.cat(
+            attrs["_schema_name"], attrs["_table_name"], delim="."
+        )
+
         new_class = super().__new__(cls, name, bases, attrs)
         return new_class
 
@@ -274,12 +343,13 @@ class TableMeta(type):
 class Table(metaclass=TableMeta):
     _schema_name: ClassVar[LiteralString | None] = None
     _table_name: ClassVar[LiteralString]
+    _path: ClassVar[LiteralString]
 
     ALL: ClassVar[Column] = Column("*")
 
     @classmethod
     def get_sql_parts(cls, indent: int) -> LiteralString:
-        return utils.cat(cls._schema_name, cls._table_name, delim=".")
+        return cls._path
 
     @classmethod
     def JOIN(cls: type[Table], other: type[Table]) -> TableDerivable:
@@ -306,9 +376,8 @@ class SchemaMeta(type):
         )
         schema_name = attrs["_schema_name"]
 
-        wrapped_attrs = attrs.copy()
-
-        # Find and replace Table attributes
+        # Find Table attributes, then replace them in place
+        replacements: dict[str, type[Table]] = {}
         for attr_name, attr_value in attrs.items():
             if isinstance(attr_value, type) and issubclass(attr_value, Table):
                 # attr_value._schema_name = schema_name
@@ -322,10 +391,19 @@ class SchemaMeta(type):
                     tmp,
                 )
 
-                wrapped_attrs[attr_name] = proxy_class
+                # Bind the columns once here so `Schema.table.col` is a
+                # cache hit from the first access on.
+                for base in proxy_class.__mro__:
+                    for member in vars(base).values():
+                        if isinstance(member, Column) and member.name:
+                            member.__get__(None, proxy_class)
+
+                replacements[attr_name] = proxy_class
+
+        attrs.update(replacements)
 
         # Create the new class (e.g., TestSchema) using the *wrapped* attrs
-        new_class = super().__new__(cls, name, bases, wrapped_attrs)
+        new_class = super().__new__(cls, name, bases, attrs)
 
         return new_class
 
@@ -392,11 +470,13 @@ OPERATOR = (
 class Criterion(_SQLPart):
     """Represents a condition or a chain of conditions in a WHERE clause."""
 
+    __slots__ = ("_prev", "le", "neg", "op", "ri")
+
     class Prev(TypedDict):
         op: OPERATOR
         cr: Criterion
 
-    _prev: Prev
+    _prev: Prev | None
     le: Expression
     op: OPERATOR
     ri: Param | Expression
@@ -422,6 +502,7 @@ class Criterion(_SQLPart):
         self.ri = ri
 
         self.neg = neg
+        self._prev = None
 
     @staticmethod
     def NOT(le: Expression, op: OPERATOR, ri: Expression) -> Criterion:
@@ -440,12 +521,18 @@ class Criterion(_SQLPart):
     def _get_sql_part_helper(
         part: Expression, indent: int
     ) -> LiteralString | list[LiteralString]:
-        sql_parts = (
-            part if isinstance(part, str) else part.get_sql_parts(indent)
-        )
+        # Leaf operands are the common case, so skip the generic dispatch.
+        if type(part) is Column:
+            return part.get_path()
+        if type(part) is Param:
+            return part.get_sql_parts(indent)
+        if isinstance(part, str):
+            return part
+
+        sql_parts = part.get_sql_parts(indent)
         if isinstance(sql_parts, list):
             res: list[LiteralString] = ["("]
-            res.extend(utils.add_indent(sql_parts, indent))
+            res.extend(utils.add_indent_each(sql_parts, indent))
             res.append(")")
             return res
         else:
@@ -453,39 +540,65 @@ class Criterion(_SQLPart):
                 return f"({sql_parts})"
             return sql_parts
 
-    @override
-    def get_sql_parts(self, indent: int) -> LiteralString | list[LiteralString]:
-        """Gets the SQL parts for this condition."""
+    def _get_own_sql_parts(
+        self, indent: int
+    ) -> LiteralString | list[LiteralString]:
+        """Gets the SQL parts for this condition alone, without `_prev`."""
         le = self._get_sql_part_helper(self.le, indent)
         ri = self._get_sql_part_helper(self.ri, indent)
+        neg = "NOT " if self.neg else ""
 
         if isinstance(le, str) and isinstance(ri, str):
             # Single line
-            return f"{le} {self.op} {ri}"
+            return f"{neg}{le} {self.op} {ri}"
 
+        # Build the line joining both sides once instead of growing it
+        # with repeated `+=`.
         res: list[LiteralString] = []
         if isinstance(le, list):
             res.extend(le)
-        else:
-            res.append(le)
-
-        res[-1] += f" {self.op} "
+            le = res.pop()
 
         if isinstance(ri, list):
+            res.append(f"{le} {self.op} ")
             res.extend(ri)
         else:
-            res[-1] += ri
+            res.append(f"{le} {self.op} {ri}")
 
-        if self.neg:
-            res[0] = "NOT " + res[0]
+        if neg:
+            res[0] = neg + res[0]
+        return res
 
-        if self._prev is not None:
-            prev = self._prev["cr"].get_sql_parts(indent)
-            res[0] = self._prev["op"] + " " + res[0]
-            if isinstance(prev, list):
-                res = prev + res
+    @override
+    def get_sql_parts(self, indent: int) -> LiteralString | list[LiteralString]:
+        """Gets the SQL parts for this condition."""
+        if self._prev is None:
+            return self._get_own_sql_parts(indent)
+
+        # Walk the AND/OR chain back to its first condition in a loop,
+        # instead of recursing once per link, then emit it in order.
+        chain: list[tuple[OPERATOR, Criterion]] = []
+        cur = self
+        prev = cur._prev
+        # AND/OR link their argument in place, so `c.AND(c)` makes a cycle.
+        seen = {id(cur)}
+        while prev is not None:
+            chain.append((prev["op"], cur))
+            cur = prev["cr"]
+            if id(cur) in seen:
+                raise ValueError("Criterion chain links back to itself.")
+            seen.add(id(cur))
+            prev = cur._prev
+
+        first = cur._get_own_sql_parts(indent)
+        res = [first] if isinstance(first, str) else first
+        for op, cr in reversed(chain):
+            parts = cr._get_own_sql_parts(indent)
+            if isinstance(parts, str):
+                res.append(f"{op} {parts}")
             else:
-                res.insert(0, prev)
+                res.append(f"{op} {parts[0]}")
+                res.extend(parts[1:])
         return res
 
 
@@ -496,6 +609,8 @@ SET_QUANTIFIER = Literal["ALL", "DISTINCT"]
 
 @final
 class ORDER_BY(_SQLPart, _HasStateSelect):
+    __slots__ = ("orders",)
+
     class OrderingBy(TypedDict):
         expr: LiteralString | ColumnDerivable
         by: Literal["ASC", "DESC"]
@@ -513,8 +628,7 @@ class ORDER_BY(_SQLPart, _HasStateSelect):
         statement: Statement_SELECT,
         *orders: Ordering | LiteralString | ColumnDerivable,
     ) -> None:
-        self.statement = statement
-        self.statement["ORDER_BY"] = self
+        self.statement = _extend(statement, "ORDER_BY", self)
         self.orders = list(orders)
 
     @override
@@ -524,11 +638,12 @@ class ORDER_BY(_SQLPart, _HasStateSelect):
 
 @final
 class HAVING(_SQLPart, _HasStateSelect):
+    __slots__ = ("condition",)
+
     def __init__(
         self, statement: Statement_SELECT, condition: Criterion
     ) -> None:
-        self.statement = statement
-        self.statement["HAVING"] = self
+        self.statement = _extend(statement, "HAVING", self)
         self.condition = condition
 
     @override
@@ -536,20 +651,29 @@ class HAVING(_SQLPart, _HasStateSelect):
         tmp = self.condition.get_sql_parts(indent)
         res: list[LiteralString] = ["HAVING"]
         if isinstance(tmp, list):
-            res.extend(utils.add_indent(tmp, indent))
+            res.extend(utils.add_indent_each(tmp, indent))
         else:
             res.append(indent * " " + tmp)
         return res
 
 
 class _Having_able(_HasStateSelect):
+    __slots__ = ()
+
     def HAVING(self, condition: Criterion):
         return HAVING(self.statement, condition)
 
 
 @final
 class GROUP_BY(_Having_able, _SQLPart, _HasStateSelect):
+    __slots__ = ("cols", "mode")
+
     GROUP_BY_MODE = Literal["ALL", "DISTINCT", None]
+    _HEADERS: ClassVar[dict[GROUP_BY_MODE, LiteralString]] = {
+        None: "GROUP BY",
+        "ALL": "GROUP BY ALL",
+        "DISTINCT": "GROUP BY DISTINCT",
+    }
 
     def __init__(
         self,
@@ -557,27 +681,24 @@ class GROUP_BY(_Having_able, _SQLPart, _HasStateSelect):
         *cols: Column | LiteralString,
         mode: GROUP_BY_MODE = None,
     ) -> None:
-        self.statement = statement
+        self.statement = _extend(statement, "GROUP_BY", self)
         self.cols = list(cols)
-        self.statement["GROUP_BY"] = self
         self.mode = mode
 
     @override
     def get_sql_parts(self, indent: int) -> LiteralString | list[LiteralString]:
-        res: list[LiteralString] = []
-        if self.mode is not None:
-            res.append("GROUP BY " + self.mode)
-        else:
-            res.append("GROUP BY")
+        res: list[LiteralString] = [self._HEADERS[self.mode]]
         cols: list[LiteralString] = [
             it if isinstance(it, str) else it.get_sql_parts(indent)
             for it in self.cols
         ]
-        res.extend(utils.add_indent(cols, indent))
+        res.extend(utils.add_indent_each(cols, indent))
         return res
 
 
 class _GROUP_BY_able(_HasStateSelect):
+    __slots__ = ()
+
     def GROUP_BY(self, *cols: Column | LiteralString):
         return GROUP_BY(self.statement, *cols)
 
@@ -590,11 +711,12 @@ class _GROUP_BY_able(_HasStateSelect):
 
 @final
 class WHERE(_GROUP_BY_able, _SQLPart, _HasStateSelect):
+    __slots__ = ("condition",)
+
     def __init__(
         self, statement: Statement_SELECT, condition: Criterion
     ) -> None:
-        self.statement = statement
-        self.statement["WHERE"] = self
+        self.statement = _extend(statement, "WHERE", self)
         self.condition = condition
 
     @override
@@ -602,24 +724,27 @@ class WHERE(_GROUP_BY_able, _SQLPart, _HasStateSelect):
         tmp = self.condition.get_sql_parts(indent)
         res: list[LiteralString] = ["WHERE"]
         if isinstance(tmp, list):
-            res.extend(utils.add_indent(tmp, indent))
+            res.extend(utils.add_indent_each(tmp, indent))
         else:
             res.append(indent * " " + tmp)
         return res
 
 
 class _WHERE_able(_HasStateSelect):
+    __slots__ = ()
+
     def WHERE(self, condition: Criterion):
         return WHERE(self.statement, condition)
 
 
 @final
 class FROM(_WHERE_able, TableDerivable, _HasStateSelect):
+    __slots__ = ("table",)
+
     FromArg = type[Table] | TableDerivable
 
     def __init__(self, statement: Statement_SELECT, table: FromArg) -> None:
-        self.statement = statement
-        self.statement["FROM"] = self
+        self.statement = _extend(statement, "FROM", self)
         self.table = table
 
     @override
@@ -629,18 +754,22 @@ class FROM(_WHERE_able, TableDerivable, _HasStateSelect):
         if isinstance(table, str):
             res.append(indent * " " + table)
         else:
-            res.extend(utils.add_indent(table, indent))
+            res.extend(utils.add_indent_each(table, indent))
 
         return res
 
 
 class _FROM_able(_HasStateSelect):
+    __slots__ = ()
+
     def FROM(self: _HasStateSelect, table: FROM.FromArg):
         return FROM(self.statement, table)
 
 
 @final
 class SELECT(_FROM_able, _WHERE_able, ColumnDerivable, _HasStateSelect):
+    __slots__ = ("cols", "select_mode")
+
     ColArg = ColumnDerivable | Literal["*"] | LiteralString
 
     def __init__(
@@ -661,21 +790,23 @@ class SELECT(_FROM_able, _WHERE_able, ColumnDerivable, _HasStateSelect):
 
         res: list[LiteralString] = []
         res.append("SELECT" if self.select_mode == "ALL" else "SELECT DISTINCT")
+        last = len(self.cols) - 1
         for i, col in enumerate(self.cols):
-            if isinstance(col, str):
-                res.append(indent_ + col)
+            # Single-line columns get their comma in the same format call.
+            sep = "," if i < last else ""
+            tmp = col if isinstance(col, str) else col.get_sql_parts(indent)
+            if isinstance(tmp, str):
+                res.append(f"{indent_}{tmp}{sep}")
             else:
-                tmp = col.get_sql_parts(indent)
-                if isinstance(tmp, str):
-                    res.append(indent_ + tmp)
-                else:
-                    res.extend(utils.add_indent(tmp, indent))
-            if i < len(self.cols) - 1:
-                res[-1] += ","
+                res.extend(utils.add_indent_each(tmp, indent))
+                if sep:
+                    res[-1] += sep
         return res
 
 
 class WITH(TableDerivable):
+    __slots__ = ("alias", "table")
+
     def __init__(
         self, table: TableDerivable | type[Table], alias: LiteralString
     ) -> None:
@@ -694,7 +825,11 @@ class WITH(TableDerivable):
         if isinstance(tmp, LiteralString):
             return f"{tmp} AS  {self.alias}"
         else:
-            return ["(", *utils.add_indent(tmp, indent), f") AS {self.alias}"]
+            return [
+                "(",
+                *utils.add_indent_each(tmp, indent),
+                f") AS {self.alias}",
+            ]
 
 
 class SqlBuilder:
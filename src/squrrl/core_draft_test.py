@@ -67,6 +67,19 @@ class TestPath(unittest.TestCase):
             "company.dept_info.dept",
         )
 
+    def test_bound_column_is_cached(self):
+        self.assertIs(EmployeesTable.id, EmployeesTable.id)
+        self.assertIs(CompanySchema.employees.id, CompanySchema.employees.id)
+        self.assertIsNot(EmployeesTable.id, CompanySchema.employees.id)
+
+    def test_column_path_parts_are_read_only(self):
+        col = core.Column("id", table_name="employees")
+        with self.assertRaises(AttributeError):
+            col.name = "pk"  # type: ignore[misc]
+        with self.assertRaises(AttributeError):
+            col.table_name = "dept_info"  # type: ignore[misc]
+        self.assertEqual(col.get_path(), "employees.id")
+
 
 class TestSelect(unittest.TestCase):
     def test_0(self):
@@ -106,6 +119,59 @@ class TestCondition(unittest.TestCase):
         ).get_sql_parts(0)
         self.assertEqual(res, "employees.name = employees.dept")
 
+    def test_param(self):
+        res = core.Criterion(
+            EmployeesTable.id, "=", core.Param("emp_id")
+        ).get_sql_parts(0)
+        self.assertEqual(res, "employees.id = :emp_id")
+
+    def test_param_config(self):
+        p = core.Param()
+        self.addCleanup(
+            setattr, core.Param.Config, "param_str", core.Param.Config.param_str
+        )
+        core.Param.Config.param_str = "?"
+        self.assertEqual(p.get_sql_parts(0), "?")
+        res = core.Criterion(EmployeesTable.id, "=", p).get_sql_parts(0)
+        self.assertEqual(res, "employees.id = ?")
+
+    def test_not(self):
+        res = core.Criterion.NOT("1", "=", "1").get_sql_parts(0)
+        self.assertEqual(res, "NOT 1 = 1")
+
+    def test_chain(self):
+        res = (
+            core.Criterion("1", "=", "1")
+            .AND(core.Criterion("2", "=", "2"))
+            .OR(core.Criterion.NOT("3", "=", "3"))
+            .get_sql_parts(0)
+        )
+        self.assertEqual(res, ["1 = 1", "AND 2 = 2", "OR NOT 3 = 3"])
+
+    def test_chain_nested(self):
+        inner = core.Criterion("a", "=", "b").AND(core.Criterion("c", "=", "d"))
+        res = (
+            core.Criterion("1", "=", "1")
+            .AND(core.Criterion(inner, "=", "x"))
+            .get_sql_parts(2)
+        )
+        self.assertEqual(
+            res, ["1 = 1", "AND (", "  a = b", "  AND c = d", ") = x"]
+        )
+
+    def test_chain_cycle(self):
+        a = core.Criterion("1", "=", "1")
+        a.AND(a)
+        with self.assertRaises(ValueError):
+            a.get_sql_parts(0)
+
+        b = core.Criterion("2", "=", "2")
+        c = core.Criterion("3", "=", "3")
+        b.AND(c)
+        c.AND(b)
+        with self.assertRaises(ValueError):
+            b.get_sql_parts(0)
+
 
 class TestWhere(unittest.TestCase):
     def test_0(self):
@@ -150,6 +216,26 @@ class TestHaving(unittest.TestCase):
         )
 
 
+class TestBranching(unittest.TestCase):
+    def test_0(self):
+        base = (
+            core.SqlBuilder.SELECT("*")
+            .FROM(EmployeesTable)
+            .WHERE(core.Criterion("1", "=", "1"))
+        )
+        by_name = base.GROUP_BY(EmployeesTable.name)
+        by_dept = base.GROUP_BY(EmployeesTable.dept)
+        self.assertEqual(base.get_sql(), "SELECT * FROM employees WHERE 1 = 1")
+        self.assertEqual(
+            by_name.get_sql(),
+            "SELECT * FROM employees WHERE 1 = 1 GROUP BY employees.name",
+        )
+        self.assertEqual(
+            by_dept.get_sql(),
+            "SELECT * FROM employees WHERE 1 = 1 GROUP BY employees.dept",
+        )
+
+
 # class TestCondition(unittest.TestCase):
 #     def test_with_params(self):
 #         cond = core.Condition(
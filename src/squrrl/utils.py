@@ -1,42 +1,35 @@
 from __future__ import annotations
 
-from typing import Iterable, TypeGuard, LiteralString, overload
+from typing import Iterable, LiteralString
 
 
-def nl_join(l: list[LiteralString], indent: int):
-    r"""Add new line (\\n) character bewteen strings."""
-    indent_ = " " * indent
-    return "\n".join(map(lambda it: indent_ + it, l))
-
-
-@overload
-def add_indent(
-    l: Iterable[LiteralString], indent: int
-) -> map[LiteralString]: ...
+_INDENTS: tuple[LiteralString, ...] = tuple(" " * i for i in range(33))
 
 
-@overload
-def add_indent(l: LiteralString, indent: int) -> LiteralString: ...
+def pad(indent: int) -> LiteralString:
+    """Get the whitespace string for an indent level."""
+    if 0 <= indent < len(_INDENTS):
+        return _INDENTS[indent]
+    return " " * indent
 
 
-def add_indent(l: Iterable[LiteralString] | LiteralString, indent: int):
-    indent_ = indent * " "
-    if isinstance(l, str):
-        return indent_ + l
-    else:
-
-        def anon(it: LiteralString) -> LiteralString:
-            return indent_ + it
-
-        return map(anon, l)
+def nl_join(l: list[LiteralString], indent: int):
+    r"""Add new line (\\n) character bewteen strings."""
+    if not l:
+        return ""
+    indent_ = pad(indent)
+    return indent_ + ("\n" + indent_).join(l)
 
 
-def is_not_none(a: LiteralString | None) -> TypeGuard[LiteralString]:
-    return a is not None and bool(a)
+def add_indent_each(
+    l: Iterable[LiteralString], indent: int
+) -> list[LiteralString]:
+    """Indent every line of `l`."""
+    indent_ = pad(indent)
+    return [indent_ + it for it in l]
 
 
 def cat(
     *strs: LiteralString | None, delim: LiteralString = ", "
 ) -> LiteralString:
-    a: filter[LiteralString] = filter(is_not_none, strs)
-    return delim.join(a)
+    return delim.join([s for s in strs if s])